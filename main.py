@@ -8,23 +8,46 @@ This is the main driver module responsible for:
 - Coordinating between UI rendering and game logic
 """
 
+import atexit
 import logging as log
+import logging.handlers
+from queue import SimpleQueue
 import pygame as p
 import src.game_engine as game_engine
-from src.constants import GameConstants, Square
+from src.constants import GameConstants, PROMO_MAP
 from src.ui_renderer import UIRenderer
 from src.resource_manager import ResourceManager
 
-# Configure logging to both file and console
-log.basicConfig(
-    level=log.DEBUG,
-    format="%(name)s - %(levelname)s - %(asctime)s - %(message)s",
-    datefmt="%Y-%m-%d  %H:%M:%S",
-    handlers=[
+def configure_logging():
+    """
+    Configure logging to both file and console.
+    
+    Records are queued and written by a background listener thread, so file and
+    console I/O never stall the game loop. Called from main() rather than at import
+    time, so importing this module has no logging side effects.
+    """
+    log_queue = SimpleQueue()
+    log.basicConfig(
+        level=log.INFO,  # DEBUG adds per-click and per-move-attempt tracing
+        format="%(name)s - %(levelname)s - %(asctime)s - %(message)s",
+        datefmt="%Y-%m-%d  %H:%M:%S",
+        handlers=[log.handlers.QueueHandler(log_queue)]
+    )
+    listener = log.handlers.QueueListener(
+        log_queue,
         log.FileHandler("app.log", mode="a"),
         log.StreamHandler()  # This will output logs to console
-    ]
-)
+    )
+    listener.start()
+    atexit.register(listener.stop)  # flush queued records on exit
+
+# Mouse position to board square. SQ_SIZE is a power of two (64), so the pixel
+# coordinates are shifted rather than divided; any other size falls back to //.
+_SQ_SIZE = GameConstants.SQ_SIZE
+_SQ_SHIFT = _SQ_SIZE.bit_length() - 1 if _SQ_SIZE & (_SQ_SIZE - 1) == 0 else None
+
+# Window events after which the window contents must be repainted in full
+_REPAINT_EVENTS = frozenset((p.VIDEOEXPOSE, p.WINDOWEXPOSED, p.WINDOWSHOWN, p.WINDOWRESTORED))
 
 def main():
     """
@@ -42,10 +65,15 @@ def main():
        - Move validation
        - Game termination
     """
+    configure_logging()
     p.init()
-    screen = p.display.set_mode((int(GameConstants.WIDTH), int(GameConstants.HEIGHT)))
-    clock = p.time.Clock()
+    screen = p.display.set_mode((GameConstants.WIDTH, GameConstants.HEIGHT))
     screen.fill(p.Color("white"))
+    # Only queue the events the game handles; mouse motion and other window events
+    # are discarded inside SDL instead of waking the loop and becoming Python objects.
+    # Expose/restore events are kept because the window contents must be repainted then.
+    p.event.set_blocked(None)
+    p.event.set_allowed([p.QUIT, p.MOUSEBUTTONDOWN, p.KEYDOWN] + list(_REPAINT_EVENTS))
     
     gs = game_engine.GameState()
     ui_renderer = UIRenderer(screen)
@@ -54,58 +82,79 @@ def main():
     running = True
     sqSelected = ()  # no square selected initially, tracks last click (tuple: row, col)
     playerClicks = []  # tracks player clicks for moves (two tuples: [(6,4), (4,4)])
+    needs_redraw = True  # render the first frame, then only after input has been processed
     log.info("Starting new chess game")
     
+    # Bind names used on every pass through the loop to locals
+    event_wait, event_get, get_mouse_pos = p.event.wait, p.event.get, p.mouse.get_pos
+    QUIT, MOUSEBUTTONDOWN, KEYDOWN, K_z = p.QUIT, p.MOUSEBUTTONDOWN, p.KEYDOWN, p.K_z
+    Move = game_engine.Move
+    sq_shift = _SQ_SHIFT
+    repaint_events = _REPAINT_EVENTS
+    
     while running:
-        for e in p.event.get():
-            if e.type == p.QUIT:
+        # Update display, pushing only the squares that changed
+        if needs_redraw:
+            dirty_rects = ui_renderer.draw_changes(gs, sqSelected, gs.changed_squares)
+            gs.changed_squares.clear()
+            if dirty_rects:
+                p.display.update(dirty_rects)
+            needs_redraw = False
+
+        # Sleep until input arrives instead of polling, then drain whatever else is queued
+        for e in [event_wait()] + event_get():
+            if e.type == QUIT:
                 log.info("Game terminated by user")
                 running = False
+            
+            # Window uncovered or restored: its contents are undefined, repaint it all
+            elif e.type in repaint_events:
+                ui_renderer.request_full_redraw()
+                needs_redraw = True
                 
             # Mouse input handling
-            elif e.type == p.MOUSEBUTTONDOWN:
-                location = p.mouse.get_pos()  # (x,y) location of mouse
-                col = location[0] // int(GameConstants.SQ_SIZE)
-                row = location[1] // int(GameConstants.SQ_SIZE)
+            elif e.type == MOUSEBUTTONDOWN:
+                needs_redraw = True
+                location = get_mouse_pos()  # (x,y) location of mouse
+                if sq_shift is not None:
+                    col = location[0] >> sq_shift
+                    row = location[1] >> sq_shift
+                else:
+                    col = location[0] // _SQ_SIZE
+                    row = location[1] // _SQ_SIZE
                 
                 if sqSelected == (row, col):  # user clicked same square twice
-                    log.debug(f"Square deselected at position: ({row}, {col})")
+                    log.debug("Square deselected at position: (%d, %d)", row, col)
                     sqSelected = ()  # deselect
                     playerClicks = []  # clear player clicks
                 else:
                     sqSelected = (row, col)
                     playerClicks.append(sqSelected)
-                    log.debug(f"Square selected at position: ({row}, {col})")
+                    log.debug("Square selected at position: (%d, %d)", row, col)
                 
                 # Process move after second click
                 if len(playerClicks) == 2:
-                    move = game_engine.Move(playerClicks[0], playerClicks[1], gs)
-                    log.debug(f"Attempting move from {playerClicks[0]} to {playerClicks[1]}")
+                    move = Move(playerClicks[0], playerClicks[1], gs)
+                    log.debug("Attempting move from %s to %s", playerClicks[0], playerClicks[1])
                     
-                    gs.checkMoveValidity(move)
-                    if move.valid:
+                    if gs.checkMoveValidity(move):
                         if move.isPawnPromotion:
                             promoted_piece = ui_renderer.show_promotion_dialog(gs.whiteToMove)
-                            move.promotedPiece = getattr(Square, promoted_piece)
+                            move.promotedPiece = PROMO_MAP[promoted_piece]
                         gs.makeMove(move)
                         sqSelected = ()  # reset user clicks
                         playerClicks = []
                     else:
-                        log.warning(f"Invalid move attempted from {playerClicks[0]} to {playerClicks[1]}")
+                        log.warning("Invalid move attempted from %s to %s", playerClicks[0], playerClicks[1])
                         sqSelected = ()  # reset user clicks
                         playerClicks = []
-                        move.valid = True  # reset validity flag
             
             # Keyboard input handling
-            elif e.type == p.KEYDOWN:
-                if e.key == p.K_z:  # undo move on 'z' key press
+            elif e.type == KEYDOWN:
+                needs_redraw = True
+                if e.key == K_z:  # undo move on 'z' key press
                     log.debug("Undo move requested")
                     gs.undoMove()
-        
-        # Update display
-        ui_renderer.draw_game_state(gs, sqSelected)
-        clock.tick(int(GameConstants.MAX_FPS))
-        p.display.flip()
 
 if __name__ == "__main__":
     main()
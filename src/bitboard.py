@@ -0,0 +1,265 @@
+"""
+Bitboard helpers for the chess engine.
+
+A bitboard is a Python int used as a 64-bit set of squares. Square indices run
+0-63 in board order: index = row * 8 + col, so bit 0 is a8 (row 0, col 0) and
+bit 63 is h1 (row 7, col 7), matching the row/col layout of GameState.board.
+"""
+from typing import Iterator, List, Tuple
+
+def square_index(row: int, col: int) -> int:
+    """
+    Convert board coordinates to a square index.
+
+    Args:
+        row: Row number (0-7)
+        col: Column number (0-7)
+
+    Returns:
+        int: Square index (0-63)
+    """
+    return (row << 3) | col
+
+def square_coords(sq: int) -> Tuple[int, int]:
+    """
+    Convert a square index back to board coordinates.
+
+    Args:
+        sq: Square index (0-63)
+
+    Returns:
+        Tuple[int, int]: The (row, col) of the square
+    """
+    return sq >> 3, sq & 7
+
+def iter_bits(bb: int) -> Iterator[int]:
+    """
+    Iterate over the square indices set in a bitboard, lowest first.
+
+    Isolates the lowest set bit with bb & -bb and clears it, so the loop runs
+    once per set bit rather than once per square.
+
+    Args:
+        bb: Bitboard to scan
+
+    Yields:
+        int: Index of each set square
+    """
+    while bb:
+        lsb = bb & -bb
+        yield lsb.bit_length() - 1
+        bb ^= lsb
+
+def _offset_table(offsets: Tuple[Tuple[int, int], ...]) -> List[int]:
+    """
+    Build a per-square table of the squares reached by fixed (row, col) offsets.
+
+    Args:
+        offsets: (row, col) steps from the origin square; steps leaving the board are dropped
+
+    Returns:
+        List[int]: 64 bitboards indexed by origin square
+    """
+    table = []
+    for sq in range(64):
+        row, col = square_coords(sq)
+        bb = 0
+        for d_row, d_col in offsets:
+            r, c = row + d_row, col + d_col
+            if 0 <= r < 8 and 0 <= c < 8:
+                bb |= 1 << square_index(r, c)
+        table.append(bb)
+    return table
+
+# Move tables for the non-sliding pieces, built once at import time
+KNIGHT_ATTACKS = _offset_table(((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)))
+KING_ATTACKS = _offset_table(((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)))
+
+# Pawn tables are indexed [side][sq]: side 0 is white (moving toward row 0), 1 is black
+PAWN_PUSHES = (_offset_table(((-1, 0),)), _offset_table(((1, 0),)))
+PAWN_ATTACKS = (_offset_table(((-1, -1), (-1, 1))), _offset_table(((1, -1), (1, 1))))
+
+def _ray_table(d_row: int, d_col: int) -> List[int]:
+    """
+    Build a per-square table of the squares along one sliding direction.
+
+    Args:
+        d_row: Row step of the direction
+        d_col: Column step of the direction
+
+    Returns:
+        List[int]: 64 bitboards, each holding every square from the origin to the board edge
+    """
+    table = []
+    for sq in range(64):
+        row, col = square_coords(sq)
+        bb = 0
+        r, c = row + d_row, col + d_col
+        while 0 <= r < 8 and 0 <= c < 8:
+            bb |= 1 << square_index(r, c)
+            r, c = r + d_row, c + d_col
+        table.append(bb)
+    return table
+
+# Rays that run toward higher square indices are cut at their lowest blocker,
+# rays toward lower indices at their highest
+_ROOK_RAYS_UP = (_ray_table(1, 0), _ray_table(0, 1))
+_ROOK_RAYS_DOWN = (_ray_table(-1, 0), _ray_table(0, -1))
+_BISHOP_RAYS_UP = (_ray_table(1, 1), _ray_table(1, -1))
+_BISHOP_RAYS_DOWN = (_ray_table(-1, -1), _ray_table(-1, 1))
+
+def _slide(sq: int, occ: int, rays_up: Tuple[List[int], ...], rays_down: Tuple[List[int], ...]) -> int:
+    """
+    Combine the sliding rays from a square, each stopped at (and including) its first blocker.
+
+    Args:
+        sq: Origin square index
+        occ: Occupancy bitboard of both sides
+        rays_up: Ray tables running toward higher square indices
+        rays_down: Ray tables running toward lower square indices
+
+    Returns:
+        int: Bitboard of attacked squares
+    """
+    attacks = 0
+    for rays in rays_up:
+        ray = rays[sq]
+        blockers = ray & occ
+        if blockers:
+            ray ^= rays[(blockers & -blockers).bit_length() - 1]
+        attacks |= ray
+    for rays in rays_down:
+        ray = rays[sq]
+        blockers = ray & occ
+        if blockers:
+            ray ^= rays[blockers.bit_length() - 1]
+        attacks |= ray
+    return attacks
+
+def _relevant_mask(sq: int, rays_up: Tuple[List[int], ...], rays_down: Tuple[List[int], ...]) -> int:
+    """
+    Get the squares whose occupancy can change a slider's attacks from sq.
+
+    The last square of each ray is left out: it is attacked whether or not it is occupied.
+
+    Args:
+        sq: Origin square index
+        rays_up: Ray tables running toward higher square indices
+        rays_down: Ray tables running toward lower square indices
+
+    Returns:
+        int: Bitboard of relevant blocker squares
+    """
+    mask = 0
+    for rays in rays_up:
+        ray = rays[sq]
+        if ray:
+            mask |= ray ^ (1 << (ray.bit_length() - 1))
+    for rays in rays_down:
+        ray = rays[sq]
+        mask |= ray ^ (ray & -ray)
+    return mask
+
+def _attack_tables(rays_up: Tuple[List[int], ...], rays_down: Tuple[List[int], ...]) -> Tuple[List[int], List[dict]]:
+    """
+    Precompute slider attacks for every blocker arrangement on every square.
+
+    Every subset of a square's relevant mask is enumerated with the carry-rippler
+    trick (sub = (sub - mask) & mask) and its attack set stored under that subset,
+    so a lookup is one mask and one dict probe. This plays the role of the magic
+    multiply-and-shift index, with the dict doing the perfect hashing.
+
+    Args:
+        rays_up: Ray tables running toward higher square indices
+        rays_down: Ray tables running toward lower square indices
+
+    Returns:
+        Tuple[List[int], List[dict]]: Relevant masks and attack tables, both indexed by square
+    """
+    masks = []
+    tables = []
+    for sq in range(64):
+        mask = _relevant_mask(sq, rays_up, rays_down)
+        table = {}
+        sub = 0
+        while True:
+            table[sub] = _slide(sq, sub, rays_up, rays_down)
+            sub = (sub - mask) & mask
+            if not sub:
+                break
+        masks.append(mask)
+        tables.append(table)
+    return masks, tables
+
+_ROOK_MASKS, _ROOK_TABLES = _attack_tables(_ROOK_RAYS_UP, _ROOK_RAYS_DOWN)
+_BISHOP_MASKS, _BISHOP_TABLES = _attack_tables(_BISHOP_RAYS_UP, _BISHOP_RAYS_DOWN)
+
+def rook_attacks(sq: int, occ: int) -> int:
+    """
+    Get the squares a rook on sq attacks given the board occupancy.
+
+    Args:
+        sq: Square index of the rook
+        occ: Occupancy bitboard of both sides
+
+    Returns:
+        int: Bitboard of attacked squares, including the first blocker in each direction
+    """
+    return _ROOK_TABLES[sq][occ & _ROOK_MASKS[sq]]
+
+def bishop_attacks(sq: int, occ: int) -> int:
+    """
+    Get the squares a bishop on sq attacks given the board occupancy.
+
+    Args:
+        sq: Square index of the bishop
+        occ: Occupancy bitboard of both sides
+
+    Returns:
+        int: Bitboard of attacked squares, including the first blocker in each direction
+    """
+    return _BISHOP_TABLES[sq][occ & _BISHOP_MASKS[sq]]
+
+def queen_attacks(sq: int, occ: int) -> int:
+    """
+    Get the squares a queen on sq attacks given the board occupancy.
+
+    Args:
+        sq: Square index of the queen
+        occ: Occupancy bitboard of both sides
+
+    Returns:
+        int: Bitboard of attacked squares, including the first blocker in each direction
+    """
+    return _ROOK_TABLES[sq][occ & _ROOK_MASKS[sq]] | _BISHOP_TABLES[sq][occ & _BISHOP_MASKS[sq]]
+
+def _line_tables() -> Tuple[List[List[int]], List[List[int]]]:
+    """
+    Build the squares between and through every pair of aligned squares.
+
+    Returns:
+        Tuple[List[List[int]], List[List[int]]]: BETWEEN and LINE, both indexed [a][b].
+        BETWEEN holds the squares strictly between a and b; LINE holds the whole
+        rank, file or diagonal through both. Unaligned pairs are 0 in both.
+    """
+    between = [[0] * 64 for _ in range(64)]
+    line = [[0] * 64 for _ in range(64)]
+    for d_row, d_col in ((1, 0), (0, 1), (1, 1), (1, -1)):
+        forward = _ray_table(d_row, d_col)
+        backward = _ray_table(-d_row, -d_col)
+        for sq in range(64):
+            full = forward[sq] | backward[sq] | (1 << sq)
+            row, col = square_coords(sq)
+            for step_row, step_col in ((d_row, d_col), (-d_row, -d_col)):
+                # Walk outward from sq, collecting the squares passed so far
+                path = 0
+                r, c = row + step_row, col + step_col
+                while 0 <= r < 8 and 0 <= c < 8:
+                    target = square_index(r, c)
+                    between[sq][target] = path
+                    line[sq][target] = full
+                    path |= 1 << target
+                    r, c = r + step_row, c + step_col
+    return between, line
+
+BETWEEN, LINE = _line_tables()
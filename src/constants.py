@@ -1,15 +1,14 @@
 from enum import StrEnum, IntEnum
 
-class GameConstants(StrEnum):
+class GameConstants(IntEnum):
     """
     Basic game window and board configuration constants.
-    All values are strings for compatibility with pygame configuration.
+    Sizes are in pixels and can be passed to pygame as they are.
     """
-    WIDTH = '512'
-    HEIGHT = '512'
-    DIMENSION = '8'
-    SQ_SIZE = '64'  # HEIGHT // DIMENSION (512 // 8)
-    MAX_FPS = '15'
+    WIDTH = 512
+    HEIGHT = 512
+    DIMENSION = 8
+    SQ_SIZE = 64  # HEIGHT // DIMENSION (512 // 8)
 
 class UIConstants(IntEnum):
     """
@@ -75,6 +74,17 @@ class MoveRules(IntEnum):
     KING_CASTLING_DISTANCE = 2  # Number of squares the king moves during castling
     MAX_KING_MOVE = 1  # Maximum distance for normal king moves
 
+class CastlingFlags(IntEnum):
+    """
+    Bits of the castling rights mask.
+    Each right is lost independently when its king or rook leaves (or is captured on) its home square.
+    """
+    WHITE_KINGSIDE = 1
+    WHITE_QUEENSIDE = 2
+    BLACK_KINGSIDE = 4
+    BLACK_QUEENSIDE = 8
+    ALL = 15
+
 # Global dictionary for piece images, populated at runtime
 IMAGES = {}
 
@@ -133,4 +143,28 @@ class Square(StrEnum):
         Returns:
             Square: The corresponding Square enum value for the piece
         """
-        return cls(player + piece)
\ No newline at end of file
+        return cls(player + piece)
+
+# Integer piece ids (white pawn..king = 0-5, black pawn..king = 6-11). They index
+# GameState.bitboards and the id-ordered piece image list.
+PIECES = (
+    Square.wp, Square.wN, Square.wB, Square.wR, Square.wQ, Square.wK,
+    Square.bp, Square.bN, Square.bB, Square.bR, Square.bQ, Square.bK,
+)
+PIECE_IDS = {piece: piece_id for piece_id, piece in enumerate(PIECES)}
+
+# PieceType of each piece, indexed by piece id
+PIECE_TYPES = tuple(PieceType(piece.value[1]) for piece in PIECES)
+
+# piece_id // PIECES_PER_SIDE gives the side index: 0 for white, 1 for black.
+# It indexes GameState.occupancy.
+PIECES_PER_SIDE = 6
+
+# Piece id stored for an empty square in GameState.piece_ids
+NO_PIECE = -1
+
+# Promotion dialog results ('wQ', 'bN', ...) mapped straight to their Square values
+PROMO_MAP = {piece.name: piece for piece in (
+    Square.wQ, Square.wR, Square.wB, Square.wN,
+    Square.bQ, Square.bR, Square.bB, Square.bN,
+)}
@@ -3,20 +3,54 @@ This module is responsible for storing and managing the current state of a chess
 including move validation, game state updates, and special move handling.
 """
 import logging as log
-from typing import Optional, List, Tuple
-from src.constants import Square, Player, PieceType
+from array import array
+from typing import Iterator, Optional, List, Set, Tuple
+from src.bitboard import (square_index, square_coords, iter_bits, KNIGHT_ATTACKS, KING_ATTACKS,
+                          PAWN_PUSHES, PAWN_ATTACKS, BETWEEN, LINE, rook_attacks, bishop_attacks,
+                          queen_attacks)
+from src.constants import Square, Player, PieceType, BoardPositions, CastlingFlags, PIECE_IDS, PIECES, PIECES_PER_SIDE, PIECE_TYPES, NO_PIECE
 from src.move_validation import MoveValidatorFactory
 from src.moves import Move
+from src.zobrist import PIECE_SQUARE_KEYS, BLACK_TO_MOVE_KEY, CASTLING_KEYS, EN_PASSANT_FILE_KEYS
 
-class CastlingRights:
-    def __init__(self, white_can_castle: bool = True, black_can_castle: bool = True):
-        self.white_can_castle = white_can_castle
-        self.black_can_castle = black_can_castle
+# Piece ids of the white and black king, indexed by side
+_KING_IDS = (PIECE_IDS[Square.wK], PIECE_IDS[Square.bK])
+_PAWNS = (Square.wp, Square.bp)
+_ROOKS = (Square.wR, Square.bR)
+
+def _build_castling_masks() -> List[int]:
+    """
+    Build the per-square masks ANDed into the castling rights after every move.
+
+    A move from or to a king or rook home square clears the rights that depend on
+    that piece; every other square keeps all rights.
+
+    Returns:
+        List[int]: 64 masks indexed by square index
+    """
+    masks = [int(CastlingFlags.ALL)] * 64
+    for row, kingside, queenside in (
+        (BoardPositions.WHITE_PIECES_RANK, CastlingFlags.WHITE_KINGSIDE, CastlingFlags.WHITE_QUEENSIDE),
+        (BoardPositions.BLACK_PIECES_RANK, CastlingFlags.BLACK_KINGSIDE, CastlingFlags.BLACK_QUEENSIDE),
+    ):
+        masks[square_index(row, BoardPositions.KING_START_FILE)] &= ~(kingside | queenside)
+        masks[square_index(row, BoardPositions.KINGSIDE_ROOK_FILE)] &= ~kingside
+        masks[square_index(row, BoardPositions.QUEENSIDE_ROOK_FILE)] &= ~queenside
+    return masks
+
+_CASTLING_MASKS = _build_castling_masks()
 
 class GameState:
     """
     Represents the current state of a chess game, including the board position,
     move history, and special conditions like castling rights and en-passant possibilities.
+    
+    The position is kept both as an 8x8 board of Square values and as one bitboard
+    per piece (see src.bitboard), indexed by the piece ids in PIECE_IDS, plus one
+    occupancy bitboard per side. piece_ids holds the same position as a flat
+    array of piece ids by square index, for O(1) integer lookups, and zobrist
+    hashes the pieces and side to move (see src.zobrist). All board writes go
+    through _set_square so the representations never drift apart.
     """
     def __init__(self):
         # Board initialization
@@ -32,12 +66,21 @@ class GameState:
             [Square.wR, Square.wN, Square.wB, Square.wQ, 
              Square.wK, Square.wB, Square.wN, Square.wR],
         ]
+        self.bitboards: List[int] = self._build_bitboards()
+        self.occupancy: List[int] = self._build_occupancy()  # [white, black]
+        self.piece_ids: array = self._build_piece_ids()
         
         # Game state flags
         self.whiteToMove: bool = True
+        self.side_to_move: int = 0  # 0 for white, 1 for black; mirrors whiteToMove
         self.moveLog: List[Move] = []
         self.enPassantPossible: Tuple[int, int] = ()
-        self.castlingRights = CastlingRights()
+        self.castlingRights: int = int(CastlingFlags.ALL)  # OR of the CastlingFlags still available
+        self.changed_squares: Set[Tuple[int, int]] = set()  # squares touched since last render
+        self.zobrist: int = self._build_zobrist()
+        self.status_cache: dict = {}  # position_key() -> (in_check, has_legal_moves)
+        self._in_check_cache: Tuple[Optional[int], bool] = (None, False)  # (zobrist, in_check)
+        self._pin_cache: Tuple[Optional[int], int, int] = (None, 0, -1)  # (zobrist, pinned, king_sq)
         
         # Game status flags
         self.in_check: bool = False
@@ -49,36 +92,60 @@ class GameState:
     # Position and attack validation methods
     def is_square_under_attack(self, row: int, col: int, by_white: bool) -> bool:
         """Check if a square is under attack by any opponent piece."""
-        opponent_pieces = []
-        for piece in Square:
-            if piece.name[0] == 'w' and by_white:
-                opponent_pieces.append(piece)
-            elif piece.name[0] == 'b' and not by_white:
-                opponent_pieces.append(piece)
-
-        for r in range(8):
-            for c in range(8):
-                piece = self.board[r][c]
-                if piece in opponent_pieces:
-                    test_move = Move((r, c), (row, col), self)
-                    piece_type = self._get_piece_type(piece)
-                    if piece_type:
-                        validator = MoveValidatorFactory.get_validator(piece_type)
-                        if validator and validator.validate(test_move):
-                            return True
-        return False
+        sq = square_index(row, col)
+        side = 0 if by_white else 1
+        pawns, knights, bishops, rooks, queens, king = self.bitboards[side * PIECES_PER_SIDE:(side + 1) * PIECES_PER_SIDE]
+        occ = self.occupancy[0] | self.occupancy[1]
+        # A pawn attacks sq from the squares an opposite-colored pawn on sq would attack
+        return bool(
+            KNIGHT_ATTACKS[sq] & knights
+            or KING_ATTACKS[sq] & king
+            or PAWN_ATTACKS[1 - side][sq] & pawns
+            or rook_attacks(sq, occ) & (rooks | queens)
+            or bishop_attacks(sq, occ) & (bishops | queens)
+        )
 
     def get_king_position(self) -> Optional[Tuple[int, int]]:
         """Find the current player's king position."""
-        king_piece = Square.wK if self.whiteToMove else Square.bK
-        for r in range(8):
-            for c in range(8):
-                if self.board[r][c] == king_piece:
-                    return (r, c)
-        return None
+        king_bb = self.bitboards[_KING_IDS[self.side_to_move]]
+        if not king_bb:
+            return None
+        return square_coords(king_bb.bit_length() - 1)
+
+    @property
+    def occupied(self) -> int:
+        """Bitboard of every occupied square."""
+        return self.occupancy[0] | self.occupancy[1]
+
+    def position_key(self) -> int:
+        """
+        Get the Zobrist key of the current position.
+
+        Combines the incrementally maintained piece and side-to-move hash with
+        the castling rights and en passant file, which together decide the legal moves.
+
+        Returns:
+            int: 64-bit position key
+        """
+        key = self.zobrist ^ CASTLING_KEYS[self.castlingRights]
+        if self.enPassantPossible:
+            key ^= EN_PASSANT_FILE_KEYS[self.enPassantPossible[1]]
+        return key
 
     def is_in_check(self) -> bool:
-        """Check if the current player's king is in check."""
+        """
+        Check if the current player's king is in check.
+
+        The answer depends only on piece placement and side to move, which the
+        zobrist hash covers, so it is cached for the current hash and repeated
+        calls on an unchanged position skip the attack test.
+        """
+        if self._in_check_cache[0] != self.zobrist:
+            self._in_check_cache = (self.zobrist, self._is_king_attacked())
+        return self._in_check_cache[1]
+
+    def _is_king_attacked(self) -> bool:
+        """Test the current player's king for attacks, bypassing the check cache."""
         king_pos = self.get_king_position()
         if king_pos:
             return self.is_square_under_attack(king_pos[0], king_pos[1], not self.whiteToMove)
@@ -86,58 +153,115 @@ class GameState:
 
     # Move validation and execution methods
     def would_move_cause_check(self, move: Move) -> bool:
-        """Test if making a move would put or leave own king in check."""
-        original_board = [row[:] for row in self.board]
-        original_white_to_move = self.whiteToMove
+        """
+        Test if making a move would put or leave own king in check.
+
+        When the king is not in check, moving any other piece is safe unless that
+        piece is pinned and leaves the line through its king, which the pin
+        bitboard answers without touching the board (promotions included, since the
+        promoted piece stands on the same square). King moves, moves out of check
+        and en passant are tested by applying the move in place and taking it back
+        by restoring the squares it touched, so no copy of the board or bitboards
+        is made.
+        """
+        if not move.isEnPassant and move.pieceMovedId not in _KING_IDS \
+                and not self.is_in_check():
+            pinned, king_sq = self._pinned_pieces()
+            if not pinned & (1 << move.startIndex):
+                return False
+            return not LINE[king_sq][move.startIndex] & (1 << move.endIndex)
+
+        start_piece = self.board[move.startRow][move.startCol]
+        end_piece = self.board[move.endRow][move.endCol]
         
-        self._apply_move_to_board(move)
-        result = self.is_in_check()
+        self._set_square(move.startRow, move.startCol, Square.EMPTY)
+        # The promotion choice is made after validation, but any piece of the
+        # mover blocks the same lines, so the pawn stands in for it
+        self._set_square(move.endRow, move.endCol, move.promotedPiece or move.pieceMoved)
+        if move.isEnPassant:
+            # The captured pawn leaves its square too, which can open the rank
+            captured_pawn = self.board[move.enPassantCaptureRow][move.enPassantCaptureCol]
+            self._set_square(move.enPassantCaptureRow, move.enPassantCaptureCol, Square.EMPTY)
+        result = self._is_king_attacked()  # temporary position, not worth caching
         
-        self.board = [row[:] for row in original_board]
-        self.whiteToMove = original_white_to_move
+        if move.isEnPassant:
+            self._set_square(move.enPassantCaptureRow, move.enPassantCaptureCol, captured_pawn)
+        self._set_square(move.endRow, move.endCol, end_piece)
+        self._set_square(move.startRow, move.startCol, start_piece)
         return result
 
-    def checkMoveValidity(self, move: Move) -> None:
-        """Validate a move according to piece rules and check conditions."""
-        piece_type_char = Square(move.pieceMoved).name[1].lower()
-        piece_color = Square(move.pieceMoved).name[0]
-        
-        if not self._is_correct_turn(piece_color):
-            move.valid = False
-            log.warning(f"Invalid turn: {'White' if self.whiteToMove else 'Black'} to move, but {piece_color} piece selected")
-            return
-
-        piece_type = self._get_piece_type(move.pieceMoved)
-        if not piece_type:
-            move.valid = False
-            return
-
-        validator = MoveValidatorFactory.get_validator(piece_type)
-        if not validator:
-            log.error(f"No validator found for piece type: {piece_type}")
+    def _pinned_pieces(self) -> Tuple[int, int]:
+        """
+        Find the current player's pieces pinned to their king.
+
+        An enemy rook, bishop or queen that would attack the king if only enemy
+        pieces blocked is a pinner when exactly one piece, a friendly one, stands
+        between them. Cached for the current zobrist hash like is_in_check.
+
+        Returns:
+            Tuple[int, int]: Bitboard of pinned pieces and the king's square index
+        """
+        if self._pin_cache[0] != self.zobrist:
+            side = self.side_to_move
+            king_bb = self.bitboards[_KING_IDS[side]]
+            king_sq = king_bb.bit_length() - 1
+            pinned = 0
+            if king_bb:
+                enemy = 1 - side
+                _, _, bishops, rooks, queens, _ = \
+                    self.bitboards[enemy * PIECES_PER_SIDE:(enemy + 1) * PIECES_PER_SIDE]
+                own = self.occupancy[side]
+                enemy_occ = self.occupancy[enemy]
+                snipers = ((rook_attacks(king_sq, enemy_occ) & (rooks | queens))
+                           | (bishop_attacks(king_sq, enemy_occ) & (bishops | queens)))
+                for sniper in iter_bits(snipers):
+                    blockers = BETWEEN[king_sq][sniper] & (own | enemy_occ)
+                    if blockers & own and not blockers & (blockers - 1):
+                        pinned |= blockers
+            self._pin_cache = (self.zobrist, pinned, king_sq)
+        return self._pin_cache[1], self._pin_cache[2]
+
+    def checkMoveValidity(self, move: Move) -> bool:
+        """
+        Validate a move according to piece rules and check conditions.
+
+        The result is also stored on move.valid, which makeMove checks.
+
+        Returns:
+            bool: True if the move is legal
+        """
+        if not self._is_correct_turn(move.pieceMovedId):
             move.valid = False
-            return
+            log.warning("Invalid turn: %s to move, but %s selected",
+                        'White' if self.whiteToMove else 'Black', move.pieceMoved)
+            return False
 
+        # The turn check above rules out empty squares, so the id is a real piece
+        validator = MoveValidatorFactory.get_validator_for_piece(move.pieceMovedId)
         move.valid = validator.validate(move) and not self.would_move_cause_check(move)
-        log.debug(f"Move validation result for {piece_type} from {(move.startRow, move.startCol)} to {(move.endRow, move.endCol)}: {'Valid' if move.valid else 'Invalid'}")
+        return move.valid
 
     def makeMove(self, move: Move) -> None:
         """Execute a validated move and update game state."""
         if not move.valid:
             return
 
-        # Store state for potential undo
-        previous_state = self._store_previous_state()
+        # Store state for potential undo; both are immutable, so no copy is needed
+        move.previousEnPassantPossible = self.enPassantPossible
+        move.previousCastlingRights = self.castlingRights
         
         # Reset en passant possibility
         self.enPassantPossible = ()
 
+        # Every move type vacates the start square and places the mover (or its
+        # promotion) on the end square; only the side effects differ
+        self._apply_move_to_board(move)
         if move.isCastling:
             self._execute_castling_move(move)
         elif move.isEnPassant:
             self._execute_en_passant_move(move)
-        else:
-            self._execute_regular_move(move)
+
+        self._mark_changed_squares(move)
 
         # Update en passant possibility for pawn double moves
         self._update_en_passant_possibility(move)
@@ -146,8 +270,6 @@ class GameState:
         self.updateCastlingRights(move)
         
         # Log move and update game state
-        move.previousEnPassantPossible = previous_state["enPassantPossible"]
-        move.previousCastlingRights = previous_state["castlingRights"]
         self.moveLog.append(move)
         self.swap_players()
         self.update_game_state()
@@ -159,12 +281,14 @@ class GameState:
             return
             
         move = self.moveLog.pop()
+        self._set_square(move.startRow, move.startCol, move.pieceMoved)
         if move.isCastling:
             self._undo_castling_move(move)
         elif move.isEnPassant:
             self._undo_en_passant_move(move)
         else:
-            self._undo_regular_move(move)
+            self._set_square(move.endRow, move.endCol, move.pieceCaptured)
+        self._mark_changed_squares(move)
 
         # Restore previous state
         self.enPassantPossible = move.previousEnPassantPossible
@@ -172,152 +296,202 @@ class GameState:
         self.swap_players()
 
     # Helper methods
-    def _get_piece_type(self, piece: Square) -> Optional[PieceType]:
-        """Map a piece to its corresponding PieceType."""
-        piece_type_map = {
-            'r': PieceType.ROOK,
-            'n': PieceType.KNIGHT,
-            'b': PieceType.BISHOP,
-            'q': PieceType.QUEEN,
-            'k': PieceType.KING,
-            'p': PieceType.PAWN
-        }
-        try:
-            return piece_type_map[piece.name[1].lower()]
-        except KeyError:
-            log.error(f"Failed to map piece type for: {piece}")
-            return None
+    def _is_correct_turn(self, piece_id: int) -> bool:
+        """Check if the piece id belongs to the player whose turn it is (never true for NO_PIECE)."""
+        return piece_id // PIECES_PER_SIDE == self.side_to_move
 
-    def _is_correct_turn(self, piece_color: str) -> bool:
-        """Check if it's the correct player's turn."""
-        return ((self.whiteToMove and piece_color == 'w') or 
-                (not self.whiteToMove and piece_color == 'b'))
-
-    def _store_previous_state(self) -> dict:
-        """Store current state for potential undo."""
-        return {
-            "enPassantPossible": self.enPassantPossible,
-            "castlingRights": CastlingRights(
-                self.castlingRights.white_can_castle,
-                self.castlingRights.black_can_castle
-            )
-        }
+    def _build_bitboards(self) -> List[int]:
+        """Build one bitboard per piece id from the current board."""
+        bitboards = [0] * len(PIECES)
+        for r in range(8):
+            for c in range(8):
+                piece_id = PIECE_IDS.get(self.board[r][c])
+                if piece_id is not None:
+                    bitboards[piece_id] |= 1 << square_index(r, c)
+        return bitboards
+
+    def _build_occupancy(self) -> List[int]:
+        """Combine the piece bitboards into one occupancy bitboard per side."""
+        occupancy = [0, 0]
+        for piece_id, bb in enumerate(self.bitboards):
+            occupancy[piece_id // PIECES_PER_SIDE] |= bb
+        return occupancy
+
+    def _build_piece_ids(self) -> array:
+        """Build the flat array of piece ids (NO_PIECE for empty) from the current board."""
+        return array('b', [PIECE_IDS.get(piece, NO_PIECE) for row in self.board for piece in row])
+
+    def _build_zobrist(self) -> int:
+        """Hash the pieces and side to move from scratch."""
+        key = 0 if self.whiteToMove else BLACK_TO_MOVE_KEY
+        for piece_id, bb in enumerate(self.bitboards):
+            for sq in iter_bits(bb):
+                key ^= PIECE_SQUARE_KEYS[piece_id][sq]
+        return key
+
+    def _set_square(self, row: int, col: int, piece: Square) -> None:
+        """Place a piece (or EMPTY) on a square, keeping the bitboards in sync."""
+        sq = square_index(row, col)
+        bit = 1 << sq
+        old_id = self.piece_ids[sq]
+        if old_id != NO_PIECE:
+            self.bitboards[old_id] ^= bit
+            self.occupancy[old_id // PIECES_PER_SIDE] ^= bit
+            self.zobrist ^= PIECE_SQUARE_KEYS[old_id][sq]
+        new_id = PIECE_IDS.get(piece, NO_PIECE)
+        if new_id != NO_PIECE:
+            self.bitboards[new_id] |= bit
+            self.occupancy[new_id // PIECES_PER_SIDE] |= bit
+            self.zobrist ^= PIECE_SQUARE_KEYS[new_id][sq]
+        self.piece_ids[sq] = new_id
+        self.board[row][col] = piece
 
     def _apply_move_to_board(self, move: Move) -> None:
         """Apply a move to the board without state updates."""
-        self.board[move.startRow][move.startCol] = Square.EMPTY
+        self._set_square(move.startRow, move.startCol, Square.EMPTY)
         if move.isPawnPromotion:
-            self.board[move.endRow][move.endCol] = move.promotedPiece
+            self._set_square(move.endRow, move.endCol, move.promotedPiece)
         else:
-            self.board[move.endRow][move.endCol] = move.pieceMoved
+            self._set_square(move.endRow, move.endCol, move.pieceMoved)
+
+    def _mark_changed_squares(self, move: Move) -> None:
+        """Record every square a move touches so the renderer can repaint only those."""
+        self.changed_squares.add((move.startRow, move.startCol))
+        self.changed_squares.add((move.endRow, move.endCol))
+        if move.isCastling:
+            self.changed_squares.add((move.rookMove.startRow, move.rookMove.startCol))
+            self.changed_squares.add((move.rookMove.endRow, move.rookMove.endCol))
+        elif move.isEnPassant:
+            self.changed_squares.add((move.enPassantCaptureRow, move.enPassantCaptureCol))
 
     def _execute_castling_move(self, move: Move) -> None:
-        """Execute a castling move."""
-        self.board[move.startRow][move.startCol] = Square.EMPTY
-        self.board[move.endRow][move.endCol] = move.pieceMoved
-        self.board[move.rookMove.startRow][move.rookMove.startCol] = Square.EMPTY
-        self.board[move.rookMove.endRow][move.rookMove.endCol] = \
-            Square.wR if move.pieceMoved == Square.wK else Square.bR
+        """Move the rook of a castling move; the king is placed by _apply_move_to_board."""
+        self._set_square(move.rookMove.startRow, move.rookMove.startCol, Square.EMPTY)
+        self._set_square(move.rookMove.endRow, move.rookMove.endCol,
+                         _ROOKS[move.pieceMovedId // PIECES_PER_SIDE])
 
     def _execute_en_passant_move(self, move: Move) -> None:
-        """Execute an en passant move."""
-        self.board[move.startRow][move.startCol] = Square.EMPTY
-        self.board[move.endRow][move.endCol] = move.pieceMoved
-        self.board[move.enPassantCaptureRow][move.enPassantCaptureCol] = Square.EMPTY
-        move.pieceCaptured = Square.wp if move.pieceMoved == Square.bp else Square.bp
-
-    def _execute_regular_move(self, move: Move) -> None:
-        """Execute a regular move or pawn promotion."""
-        self._apply_move_to_board(move)
+        """Remove the pawn captured en passant; the mover is placed by _apply_move_to_board."""
+        self._set_square(move.enPassantCaptureRow, move.enPassantCaptureCol, Square.EMPTY)
+        move.pieceCaptured = _PAWNS[1 - move.pieceMovedId // PIECES_PER_SIDE]
+        move.pieceCapturedId = PIECE_IDS[move.pieceCaptured]
 
     def _undo_castling_move(self, move: Move) -> None:
-        """Undo a castling move."""
-        self.board[move.startRow][move.startCol] = move.pieceMoved
-        self.board[move.endRow][move.endCol] = Square.EMPTY
-        self.board[move.rookMove.startRow][move.rookMove.startCol] = \
-            Square.wR if move.pieceMoved == Square.wK else Square.bR
-        self.board[move.rookMove.endRow][move.rookMove.endCol] = Square.EMPTY
+        """Undo a castling move after the king is back on its start square."""
+        self._set_square(move.endRow, move.endCol, Square.EMPTY)
+        self._set_square(move.rookMove.startRow, move.rookMove.startCol,
+                         _ROOKS[move.pieceMovedId // PIECES_PER_SIDE])
+        self._set_square(move.rookMove.endRow, move.rookMove.endCol, Square.EMPTY)
 
     def _undo_en_passant_move(self, move: Move) -> None:
-        """Undo an en passant move."""
-        self.board[move.startRow][move.startCol] = move.pieceMoved
-        self.board[move.endRow][move.endCol] = Square.EMPTY
-        self.board[move.enPassantCaptureRow][move.enPassantCaptureCol] = move.pieceCaptured
-
-    def _undo_regular_move(self, move: Move) -> None:
-        """Undo a regular move or pawn promotion."""
-        self.board[move.startRow][move.startCol] = move.pieceMoved
-        self.board[move.endRow][move.endCol] = move.pieceCaptured
+        """Undo an en passant move after the pawn is back on its start square."""
+        self._set_square(move.endRow, move.endCol, Square.EMPTY)
+        self._set_square(move.enPassantCaptureRow, move.enPassantCaptureCol, move.pieceCaptured)
 
     def _update_en_passant_possibility(self, move: Move) -> None:
         """Update en passant possibility after a pawn move."""
-        if (move.pieceMoved in (Square.wp, Square.bp) and 
+        if (PIECE_TYPES[move.pieceMovedId] == PieceType.PAWN and 
             abs(move.endRow - move.startRow) == 2):
             self.enPassantPossible = ((move.startRow + move.endRow) // 2, move.startCol)
 
     def swap_players(self) -> None:
         """Switch the active player."""
         self.whiteToMove = not self.whiteToMove
-        log.debug(f"Turn changed: {'White' if self.whiteToMove else 'Black'} to move")
+        self.side_to_move ^= 1
+        self.zobrist ^= BLACK_TO_MOVE_KEY
 
     def updateCastlingRights(self, move: Move) -> None:
-        """Update castling rights based on piece moves."""
-        # King moves
-        if move.pieceMoved == Square.wK or move.isCastling:
-            self.castlingRights.white_can_castle = False
-        elif move.pieceMoved == Square.bK or move.isCastling:
-            self.castlingRights.black_can_castle = False
-        
-        # Rook moves
-        self._update_rook_castling_rights(move)
-
-    def _update_rook_castling_rights(self, move: Move) -> None:
-        """Update castling rights specifically for rook moves or captures."""
-        if move.pieceMoved == Square.wR and move.startRow == 7:
-            if move.startCol in (0, 7):
-                self.castlingRights.white_can_castle = False
-        elif move.pieceMoved == Square.bR and move.startRow == 0:
-            if move.startCol in (0, 7):
-                self.castlingRights.black_can_castle = False
-        
-        # Rook captures
-        if move.pieceCaptured == Square.wR and move.endRow == 7:
-            if move.endCol in (0, 7):
-                self.castlingRights.white_can_castle = False
-        elif move.pieceCaptured == Square.bR and move.endRow == 0:
-            if move.endCol in (0, 7):
-                self.castlingRights.black_can_castle = False
+        """
+        Update castling rights after a move.
+
+        King moves (including castling), rook moves and rook captures all touch a
+        home square, so one AND with the masks of both squares covers every case.
+        """
+        self.castlingRights &= _CASTLING_MASKS[move.startIndex] & _CASTLING_MASKS[move.endIndex]
 
     def get_all_possible_moves(self) -> List[Move]:
         """Get all valid moves for the current player."""
-        moves = []
-        for r in range(8):
-            for c in range(8):
-                piece = self.board[r][c]
-                if ((self.whiteToMove and piece.name.startswith('w')) or 
-                    (not self.whiteToMove and piece.name.startswith('b'))):
-                    for end_r in range(8):
-                        for end_c in range(8):
-                            move = Move((r, c), (end_r, end_c), self)
-                            self.checkMoveValidity(move)
-                            if move.valid:
-                                moves.append(move)
-        return moves
+        return list(self.iter_legal_moves())
+
+    def iter_legal_moves(self) -> Iterator[Move]:
+        """
+        Yield the valid moves for the current player one at a time.
+
+        Destinations come from the attack tables, so only squares a piece could
+        plausibly reach are validated instead of all 64. Moves are built and
+        validated only as the caller consumes them, so a caller that stops early
+        skips the rest of the work. The position must not change mid-iteration.
+        """
+        side = self.side_to_move
+        occ = self.occupancy[0] | self.occupancy[1]
+        for sq in iter_bits(self.occupancy[side]):
+            start = square_coords(sq)
+            targets = self._candidate_targets(sq, self.piece_ids[sq], side, occ)
+            for end_sq in iter_bits(targets):
+                move = Move(start, square_coords(end_sq), self)
+                if self.checkMoveValidity(move):
+                    yield move
+
+    def has_legal_move(self) -> bool:
+        """Check whether the current player has any valid move, stopping at the first one found."""
+        return next(self.iter_legal_moves(), None) is not None
+
+    def _candidate_targets(self, sq: int, piece_id: int, side: int, occ: int) -> int:
+        """
+        Get a superset of the squares a piece may move to, for full validation.
+
+        Args:
+            sq: Square index of the piece
+            piece_id: Piece id of the piece
+            side: 0 for white, 1 for black
+            occ: Occupancy bitboard of both sides
+
+        Returns:
+            int: Bitboard of candidate destination squares
+        """
+        piece_type = PIECE_TYPES[piece_id]
+        if piece_type == PieceType.PAWN:
+            # Single and double pushes, captures and the en passant square
+            push = PAWN_PUSHES[side][sq]
+            targets = push | PAWN_ATTACKS[side][sq]
+            if push:
+                targets |= PAWN_PUSHES[side][push.bit_length() - 1]
+            return targets
+        if piece_type == PieceType.KNIGHT:
+            targets = KNIGHT_ATTACKS[sq]
+        elif piece_type == PieceType.BISHOP:
+            targets = bishop_attacks(sq, occ)
+        elif piece_type == PieceType.ROOK:
+            targets = rook_attacks(sq, occ)
+        elif piece_type == PieceType.QUEEN:
+            targets = queen_attacks(sq, occ)
+        else:
+            # King steps plus the two castling destinations on its own rank
+            targets = KING_ATTACKS[sq]
+            if sq & 7 == BoardPositions.KING_START_FILE:
+                targets |= (1 << (sq - 2)) | (1 << (sq + 2))
+        return targets & ~self.occupancy[side]
 
     def update_game_state(self) -> None:
-        """Update check, checkmate, and stalemate status."""
-        self.in_check = self.is_in_check()
-        possible_moves = self.get_all_possible_moves()
+        """
+        Update check, checkmate, and stalemate status.
+
+        Results are cached by position key, so a position reached again (by
+        transposition or by undoing and replaying) skips move generation.
+        """
+        key = self.position_key()
+        status = self.status_cache.get(key)
+        if status is None:
+            status = self.status_cache[key] = (self.is_in_check(), self.has_legal_move())
+        self.in_check, has_legal_moves = status
         
-        if not possible_moves:
+        if not has_legal_moves:
             if self.in_check:
                 self.checkmate = True
-                log.info(f"Checkmate! {'Black' if self.whiteToMove else 'White'} wins!")
+                log.info("Checkmate! %s wins!", 'Black' if self.whiteToMove else 'White')
             else:
                 self.stalemate = True
                 log.info("Stalemate!")
         else:
             self.checkmate = False
             self.stalemate = False
-
-
@@ -1,7 +1,37 @@
 from abc import ABC, abstractmethod
-import logging as log
-from typing import List, Tuple
-from src.constants import Square, Player, PieceType, BoardPositions, MoveRules
+from src.bitboard import KNIGHT_ATTACKS, KING_ATTACKS, PAWN_PUSHES, PAWN_ATTACKS, BETWEEN, rook_attacks, bishop_attacks, queen_attacks
+from src.constants import Square, PieceType, BoardPositions, MoveRules, CastlingFlags, PIECE_IDS, PIECE_TYPES, PIECES_PER_SIDE, NO_PIECE
+from src.moves import RookMove
+
+# Indexed by side (0 white, 1 black)
+_PROMOTION_RANKS = (BoardPositions.EIGHTH_RANK, BoardPositions.FIRST_RANK)
+_PAWN_START_RANKS = (BoardPositions.WHITE_PAWN_RANK, BoardPositions.BLACK_PAWN_RANK)
+_ROOK_IDS = (PIECE_IDS[Square.wR], PIECE_IDS[Square.bR])
+
+def _build_castling_moves() -> dict:
+    """
+    Build the table of castling king moves.
+    
+    Returns:
+        dict: Maps (king_start << 6) | king_end square indices to
+            (side, castling flag, rook start column, rook end column, squares between
+            king and rook) for the four castling moves.
+    """
+    castling_moves = {}
+    for side, rank, kingside_flag, queenside_flag in (
+        (0, BoardPositions.WHITE_PIECES_RANK, CastlingFlags.WHITE_KINGSIDE, CastlingFlags.WHITE_QUEENSIDE),
+        (1, BoardPositions.BLACK_PIECES_RANK, CastlingFlags.BLACK_KINGSIDE, CastlingFlags.BLACK_QUEENSIDE),
+    ):
+        king_sq = rank * 8 + BoardPositions.KING_START_FILE
+        for flag, rook_col, step in ((kingside_flag, BoardPositions.KINGSIDE_ROOK_FILE, 1),
+                                     (queenside_flag, BoardPositions.QUEENSIDE_ROOK_FILE, -1)):
+            king_end = king_sq + step * MoveRules.KING_CASTLING_DISTANCE
+            rook_sq = rank * 8 + rook_col
+            castling_moves[(king_sq << 6) | king_end] = (
+                side, flag, rook_col, BoardPositions.KING_START_FILE + step, BETWEEN[king_sq][rook_sq])
+    return castling_moves
+
+_CASTLING_MOVES = _build_castling_moves()
 
 class MoveValidator(ABC):
     """
@@ -24,22 +54,6 @@ class MoveValidator(ABC):
         """
         pass
     
-    def _is_path_clear(self, move, path_positions: List[Tuple[int, int]]) -> bool:
-        """
-        Check if there are any pieces between start and end position.
-        
-        Args:
-            move: The move being validated
-            path_positions: List of (row, col) tuples representing the path
-            
-        Returns:
-            bool: True if path is clear, False if blocked
-        """
-        for row, col in path_positions[1:-1]:  # Exclude start and end squares
-            if move.board[row][col] != Square.EMPTY:
-                return False
-        return True
-    
     def _is_friendly_piece_at_destination(self, move) -> bool:
         """
         Check if destination contains a friendly piece.
@@ -50,36 +64,9 @@ class MoveValidator(ABC):
         Returns:
             bool: True if a friendly piece is at the destination, False otherwise
         """
-        if move.pieceCaptured == Square.EMPTY:
+        if move.pieceCapturedId == NO_PIECE:
             return False
-        moved_piece_color = Square(move.pieceMoved)[0]
-        captured_piece_color = Square(move.pieceCaptured)[0]
-        return moved_piece_color == captured_piece_color
-
-    def _get_path_positions(self, move) -> List[Tuple[int, int]]:
-        """
-        Get all positions between start and end (inclusive).
-        
-        Args:
-            move: The move being validated
-            
-        Returns:
-            List[Tuple[int, int]]: List of (row, col) positions along the move path
-        """
-        positions = []
-        row_diff = move.endRow - move.startRow
-        col_diff = move.endCol - move.startCol
-        
-        steps = max(abs(row_diff), abs(col_diff))
-        row_step = row_diff // steps if steps > 0 else 0
-        col_step = col_diff // steps if steps > 0 else 0
-        
-        for i in range(steps + 1):
-            row = move.startRow + (i * row_step)
-            col = move.startCol + (i * col_step)
-            positions.append((row, col))
-            
-        return positions
+        return move.pieceMovedId // PIECES_PER_SIDE == move.pieceCapturedId // PIECES_PER_SIDE
 
 class PawnMoveValidator(MoveValidator):
     """
@@ -94,64 +81,39 @@ class PawnMoveValidator(MoveValidator):
     """
     def validate(self, move) -> bool:
         if self._is_friendly_piece_at_destination(move):
-            log.debug("Pawn validation failed: friendly piece at destination")
             return False
             
-        piece_color = Square(move.pieceMoved)[0]
-        direction = 1 if piece_color == Player.BLACK else -1
-        log.debug(f"Pawn validation: piece_color={piece_color}, direction={direction}")
+        side = move.pieceMovedId // PIECES_PER_SIDE
+        from_sq = move.startIndex
+        to_bit = 1 << move.endIndex
         
         # Check for pawn promotion
-        if (piece_color == Player.WHITE and move.endRow == BoardPositions.EIGHTH_RANK) or \
-           (piece_color == Player.BLACK and move.endRow == BoardPositions.FIRST_RANK):
+        if move.endRow == _PROMOTION_RANKS[side]:
             move.isPawnPromotion = True
-            log.debug("Pawn validation: promotion detected")
         
-        # Normal one-square move
-        if move.pieceCaptured == Square.EMPTY and (
-            (move.startRow + direction, move.startCol) == (move.endRow, move.endCol)
-        ):
-            log.debug("Pawn validation: valid one-square move")
-            return True
-            
-        # Initial two-square move
-        log.debug(f"Pawn validation: checking two-square move - startRow={move.startRow}, WHITE_PAWN_RANK={BoardPositions.WHITE_PAWN_RANK}")
-        if move.pieceCaptured == Square.EMPTY and (
-            ((piece_color == Player.WHITE and move.startRow == BoardPositions.WHITE_PAWN_RANK) or 
-             (piece_color == Player.BLACK and move.startRow == BoardPositions.BLACK_PAWN_RANK))
-        ):
-            target_row = move.startRow + MoveRules.PAWN_FIRST_MOVE * direction
-            log.debug(f"Pawn validation: two-square move - target_row={target_row}, endRow={move.endRow}")
-            if (target_row, move.startCol) == (move.endRow, move.endCol):
-                # Check if the intermediate square is empty
-                intermediate_row = move.startRow + direction
-                log.debug(f"Pawn validation: checking intermediate square at row {intermediate_row}")
-                if move.board[intermediate_row][move.startCol] != Square.EMPTY:
-                    log.debug("Pawn validation: intermediate square blocked")
-                    return False
-                log.debug("Pawn validation: valid two-square move")
+        if move.pieceCapturedId == NO_PIECE:
+            # Normal one-square move
+            push = PAWN_PUSHES[side][from_sq]
+            if push & to_bit:
                 return True
-            
-        # Regular capture moves
-        if move.pieceCaptured != Square.EMPTY and (
-            (move.startRow + MoveRules.PAWN_REGULAR_MOVE * direction, move.startCol - 1) == (move.endRow, move.endCol) or
-            (move.startRow + MoveRules.PAWN_REGULAR_MOVE * direction, move.startCol + 1) == (move.endRow, move.endCol)
-        ):
-            log.debug("Pawn validation: valid capture move")
+                
+            # Initial two-square move, only through an empty intermediate square
+            if move.startRow == _PAWN_START_RANKS[side]:
+                if PAWN_PUSHES[side][push.bit_length() - 1] & to_bit:
+                    return not move.gameState.occupied & push
+        elif PAWN_ATTACKS[side][from_sq] & to_bit:
+            # Regular capture moves
             return True
             
         # En passant
-        if hasattr(move.gameState, 'enPassantPossible') and move.gameState.enPassantPossible:
+        if move.gameState.enPassantPossible:
             enPassant_row, enPassant_col = move.gameState.enPassantPossible
             if (move.endRow, move.endCol) == (enPassant_row, enPassant_col):
-                if abs(move.startCol - move.endCol) == MoveRules.PAWN_REGULAR_MOVE and \
-                   move.endRow == move.startRow + direction:
+                if PAWN_ATTACKS[side][from_sq] & to_bit:
                     move.isEnPassant = True
                     move.enPassantCaptureRow = move.startRow
                     move.enPassantCaptureCol = move.endCol
-                    log.debug("Pawn validation: valid en passant move")
                     return True
-        log.debug("Pawn validation: no valid move found")
         return False
 
 class RookMoveValidator(MoveValidator):
@@ -161,14 +123,11 @@ class RookMoveValidator(MoveValidator):
     Ensures moves are strictly horizontal or vertical and path is clear.
     """
     def validate(self, move) -> bool:
-        if not (move.startRow == move.endRow or move.startCol == move.endCol):
-            return False
-            
         if self._is_friendly_piece_at_destination(move):
             return False
             
-        path = self._get_path_positions(move)
-        return self._is_path_clear(move, path)
+        # Attacks stop at the first blocker, so this covers both direction and path
+        return bool(rook_attacks(move.startIndex, move.gameState.occupied) & (1 << move.endIndex))
 
 class KnightMoveValidator(MoveValidator):
     """
@@ -180,10 +139,7 @@ class KnightMoveValidator(MoveValidator):
         if self._is_friendly_piece_at_destination(move):
             return False
             
-        row_diff = abs(move.endRow - move.startRow)
-        col_diff = abs(move.endCol - move.startCol)
-        return (row_diff == MoveRules.PAWN_FIRST_MOVE and col_diff == MoveRules.PAWN_REGULAR_MOVE) or \
-               (row_diff == MoveRules.PAWN_REGULAR_MOVE and col_diff == MoveRules.PAWN_FIRST_MOVE)
+        return bool(KNIGHT_ATTACKS[move.startIndex] & (1 << move.endIndex))
 
 class BishopMoveValidator(MoveValidator):
     """
@@ -192,14 +148,10 @@ class BishopMoveValidator(MoveValidator):
     Ensures moves are strictly diagonal and path is clear.
     """
     def validate(self, move) -> bool:
-        if abs(move.endRow - move.startRow) != abs(move.endCol - move.startCol):
-            return False
-            
         if self._is_friendly_piece_at_destination(move):
             return False
             
-        path = self._get_path_positions(move)
-        return self._is_path_clear(move, path)
+        return bool(bishop_attacks(move.startIndex, move.gameState.occupied) & (1 << move.endIndex))
 
 class QueenMoveValidator(MoveValidator):
     """
@@ -208,18 +160,11 @@ class QueenMoveValidator(MoveValidator):
     Ensures moves are either straight or diagonal and path is clear.
     """
     def validate(self, move) -> bool:
-        # Queen combines Rook and Bishop movements
-        is_straight = move.startRow == move.endRow or move.startCol == move.endCol
-        is_diagonal = abs(move.endRow - move.startRow) == abs(move.endCol - move.startCol)
-        
-        if not (is_straight or is_diagonal):
-            return False
-            
         if self._is_friendly_piece_at_destination(move):
             return False
             
-        path = self._get_path_positions(move)
-        return self._is_path_clear(move, path)
+        # Queen combines Rook and Bishop movements
+        return bool(queen_attacks(move.startIndex, move.gameState.occupied) & (1 << move.endIndex))
 
 class KingMoveValidator(MoveValidator):
     """
@@ -233,53 +178,34 @@ class KingMoveValidator(MoveValidator):
         if self._is_friendly_piece_at_destination(move):
             return False
             
-        row_diff = abs(move.endRow - move.startRow)
-        col_diff = abs(move.endCol - move.startCol)
-        
         # Normal king moves
-        if row_diff <= MoveRules.MAX_KING_MOVE and col_diff <= MoveRules.MAX_KING_MOVE:
+        if KING_ATTACKS[move.startIndex] & (1 << move.endIndex):
             return True
             
-        # Castling
-        if row_diff == 0 and col_diff == MoveRules.KING_CASTLING_DISTANCE:
-            # Check if this is a castling attempt
-            is_white = Square(move.pieceMoved)[0] == Player.WHITE
-            is_kingside = move.endCol > move.startCol
-            
-            # Verify king and rook positions
-            if is_white and move.startRow != BoardPositions.WHITE_PIECES_RANK:
-                return False
-            if not is_white and move.startRow != BoardPositions.BLACK_PIECES_RANK:
-                return False
-            if move.startCol != BoardPositions.KING_START_FILE:
-                return False
-                
-            # Check castling rights
-            if (is_white and not move.gameState.castlingRights.white_can_castle) or \
-               (not is_white and not move.gameState.castlingRights.black_can_castle):
-                return False
+        # Castling: only the four king start/end pairs in the table qualify
+        castling = _CASTLING_MOVES.get((move.startIndex << 6) | move.endIndex)
+        if castling is None:
+            return False
+        side, flag, rook_col, rook_end_col, between = castling
+        if move.pieceMovedId // PIECES_PER_SIDE != side:
+            return False
             
-            # Check if squares between king and rook are empty
-            rook_col = BoardPositions.KINGSIDE_ROOK_FILE if is_kingside else BoardPositions.QUEENSIDE_ROOK_FILE
-            path = self._get_path_positions(move)
-            if not self._is_path_clear(move, path):
-                return False
-                
-            # Verify rook presence
-            expected_rook = Square.wR if is_white else Square.bR
-            if move.board[move.startRow][rook_col] != expected_rook:
-                return False
-                
-            # Set castling info
-            move.isCastling = True
-            move.rookMove.startRow = move.startRow
-            move.rookMove.startCol = rook_col
-            move.rookMove.endRow = move.startRow
-            move.rookMove.endCol = move.startCol + (1 if is_kingside else -1)
+        # Check castling rights
+        if not move.gameState.castlingRights & flag:
+            return False
+        
+        # Check if squares between king and rook are empty
+        if move.gameState.occupied & between:
+            return False
             
-            return True
+        # Verify rook presence
+        if move.gameState.piece_ids[(move.startRow << 3) | rook_col] != _ROOK_IDS[side]:
+            return False
             
-        return False
+        # Set castling info
+        move.isCastling = True
+        move.rookMove = RookMove(move.startRow, rook_col, move.startRow, rook_end_col)
+        return True
 
 class MoveValidatorFactory:
     """
@@ -298,6 +224,9 @@ class MoveValidatorFactory:
         PieceType.KING: KingMoveValidator()
     }
     
+    # Same validators indexed by integer piece id, for the per-move lookup
+    _by_piece_id = tuple(map(_validators.__getitem__, PIECE_TYPES))
+    
     @classmethod
     def get_validator(cls, piece_type: PieceType) -> MoveValidator:
         """
@@ -309,4 +238,17 @@ class MoveValidatorFactory:
         Returns:
             MoveValidator: The validator instance for the piece type
         """
-        return cls._validators.get(piece_type)
\ No newline at end of file
+        return cls._validators.get(piece_type)
+
+    @classmethod
+    def get_validator_for_piece(cls, piece_id: int) -> MoveValidator:
+        """
+        Get the move validator for an integer piece id.
+        
+        Args:
+            piece_id: Piece id (0-11) of the moving piece
+            
+        Returns:
+            MoveValidator: The validator instance for the piece's type
+        """
+        return cls._by_piece_id[piece_id]
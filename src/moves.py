@@ -3,7 +3,10 @@ Classes representing chess moves and their properties.
 This module provides classes for representing and handling chess moves,
 including special moves like castling, en passant, and pawn promotion.
 """
-from src.constants import BoardPositions, Square
+from src.constants import Square
+
+# Algebraic square names indexed by row * 8 + col (row 0 is rank 8)
+_SQUARE_NAMES = tuple(file + rank for rank in '87654321' for file in 'abcdefgh')
 
 class RookMove:
     """
@@ -18,6 +21,8 @@ class RookMove:
         endRow: Ending row of the rook
         endCol: Ending column of the rook
     """
+    __slots__ = ('startRow', 'startCol', 'endRow', 'endCol')
+    
     def __init__(self, startRow: int = None, startCol: int = None, endRow: int = None, endCol: int = None):
         self.startRow = startRow
         self.startCol = startCol
@@ -39,39 +44,31 @@ class Move:
         startCol: Starting column of the piece
         endRow: Ending row of the piece
         endCol: Ending column of the piece
+        startIndex: Square index (row * 8 + col) of the start square
+        endIndex: Square index of the end square
         pieceMoved: The piece being moved
         pieceCaptured: The piece being captured (if any)
+        pieceMovedId: Integer piece id of pieceMoved (see constants.PIECE_IDS)
+        pieceCapturedId: Integer piece id of pieceCaptured, or NO_PIECE
         valid: Whether the move is valid according to chess rules
         isCastling: Whether this is a castling move
         isEnPassant: Whether this is an en passant capture
         isPawnPromotion: Whether this is a pawn promotion move
-        rookMove: Associated rook move for castling
+        rookMove: Associated rook move for castling (None for other moves)
         promotedPiece: The piece type chosen for pawn promotion
+        previousEnPassantPossible: En passant square before the move, restored on undo
+        previousCastlingRights: Castling rights before the move, restored on undo
+        
+    Moves are created for every candidate during move generation, so the class
+    uses __slots__ to avoid a per-instance __dict__.
     """
-    
-    # Mapping between chess notation and internal board coordinates
-    ranksToRows = {
-        "1": BoardPositions.FIRST_RANK,
-        "2": BoardPositions.SECOND_RANK,
-        "3": BoardPositions.THIRD_RANK,
-        "4": BoardPositions.FOURTH_RANK,
-        "5": BoardPositions.FIFTH_RANK,
-        "6": BoardPositions.SIXTH_RANK,
-        "7": BoardPositions.SEVENTH_RANK,
-        "8": BoardPositions.EIGHTH_RANK
-    }
-    rowsToRanks = {v: k for k, v in ranksToRows.items()}
-    filesToCols = {
-        "a": BoardPositions.FIRST_FILE,
-        "b": BoardPositions.SECOND_FILE,
-        "c": BoardPositions.THIRD_FILE,
-        "d": BoardPositions.FOURTH_FILE,
-        "e": BoardPositions.FIFTH_FILE,
-        "f": BoardPositions.SIXTH_FILE,
-        "g": BoardPositions.SEVENTH_FILE,
-        "h": BoardPositions.EIGHTH_FILE
-    }
-    colsToFiles = {v: k for k, v in filesToCols.items()}
+    __slots__ = (
+        'startRow', 'startCol', 'endRow', 'endCol', 'startIndex', 'endIndex',
+        'gameState', 'board', 'pieceMoved', 'pieceCaptured', 'pieceMovedId', 'pieceCapturedId', 'valid',
+        'isCastling', 'isEnPassant', 'isPawnPromotion', 'rookMove',
+        'enPassantCaptureRow', 'enPassantCaptureCol', 'promotedPiece',
+        'previousEnPassantPossible', 'previousCastlingRights',
+    )
     
     def __init__(self, startSq: tuple[int, int], endSq: tuple[int, int], gameState):
         """
@@ -86,10 +83,15 @@ class Move:
         self.startCol = startSq[1]
         self.endRow = endSq[0]
         self.endCol = endSq[1]
+        self.startIndex = (self.startRow << 3) | self.startCol
+        self.endIndex = (self.endRow << 3) | self.endCol
         self.gameState = gameState
         self.board = gameState.board
         self.pieceMoved = gameState.board[self.startRow][self.startCol]
         self.pieceCaptured = gameState.board[self.endRow][self.endCol]
+        # Integer ids for hot-path comparisons, read from the flat id array
+        self.pieceMovedId = gameState.piece_ids[self.startIndex]
+        self.pieceCapturedId = gameState.piece_ids[self.endIndex]
         self.valid = True
         
         # Special move flags
@@ -97,8 +99,8 @@ class Move:
         self.isEnPassant = False
         self.isPawnPromotion = False
         
-        # For castling - store rook move
-        self.rookMove = RookMove()
+        # For castling - rook move, created by the king validator when castling
+        self.rookMove: RookMove = None
         
         # For en passant - store captured pawn position
         self.enPassantCaptureRow: int = None
@@ -106,6 +108,10 @@ class Move:
         
         # For pawn promotion - store promoted piece
         self.promotedPiece: Square = None
+        
+        # Set by GameState.makeMove for undo
+        self.previousEnPassantPossible = None
+        self.previousCastlingRights = None
 
     def getRankFile(self, r: int, c: int) -> str:
         """
@@ -118,7 +124,7 @@ class Move:
         Returns:
             str: Square in chess notation (e.g., 'e4')
         """
-        return self.colsToFiles[c] + self.rowsToRanks[r]
+        return _SQUARE_NAMES[(r << 3) | c]
     
     def getChessNotation(self) -> str:
         """
@@ -127,6 +133,4 @@ class Move:
         Returns:
             str: Move in chess notation (e.g., 'e2e4')
         """
-        return self.getRankFile(self.startRow, self.startCol) + self.getRankFile(
-            self.endRow, self.endCol
-        )
\ No newline at end of file
+        return _SQUARE_NAMES[self.startIndex] + _SQUARE_NAMES[self.endIndex]
\ No newline at end of file
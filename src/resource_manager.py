@@ -1,9 +1,12 @@
 import pygame as p
-from src.constants import GameConstants
+from src.constants import GameConstants, PIECES
 
 # Global dictionary mapping piece identifiers to their image resources
 IMAGES = {}
 
+# The same images indexed by piece id (see constants.PIECE_IDS), for bitboard drawing
+PIECE_IMAGES = [None] * len(PIECES)
+
 class ResourceManager:
     """
     Manages loading and scaling of game resources, specifically piece images.
@@ -19,15 +22,18 @@ class ResourceManager:
         
         Loads PNG images for all chess pieces from the images directory and scales them
         to match the square size defined in GameConstants. Images are stored in the global
-        IMAGES dictionary with keys matching piece identifiers (e.g., 'wK' for white king).
+        IMAGES dictionary with keys matching piece identifiers (e.g., 'wK' for white king),
+        and into PIECE_IMAGES at each piece's integer id.
+        Each image is converted to the display pixel format (keeping per-pixel alpha)
+        so blits skip per-frame format conversion, which means the display mode must
+        be set before calling this.
         
         The following pieces are loaded:
         - White pieces: pawn (wp), rook (wR), knight (wN), bishop (wB), king (wK), queen (wQ)
         - Black pieces: pawn (bp), rook (bR), knight (bN), bishop (bB), king (bK), queen (bQ)
         """
-        pieces = ["wp", "wR", "wN", "wB", "wK", "wQ", "bp", "bR", "bN", "bB", "bK", "bQ"]
-        for piece in pieces:
-            IMAGES[piece] = p.transform.scale(
-                p.image.load("images/" + piece + ".png"), 
-                (int(GameConstants.SQ_SIZE), int(GameConstants.SQ_SIZE))
-            )
\ No newline at end of file
+        size = (GameConstants.SQ_SIZE, GameConstants.SQ_SIZE)
+        for piece_id, piece in enumerate(PIECES):
+            image = p.transform.scale(p.image.load("images/" + piece + ".png"), size).convert_alpha()
+            IMAGES[piece] = image
+            PIECE_IMAGES[piece_id] = image
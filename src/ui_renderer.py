@@ -1,5 +1,32 @@
 import pygame as p
-from src.constants import GameConstants, UIConstants
+from src.bitboard import iter_bits
+from src.constants import GameConstants, UIConstants, NO_PIECE
+
+# Board geometry, bound once at module level
+_SQ = GameConstants.SQ_SIZE
+_DIM = GameConstants.DIMENSION
+_W = GameConstants.WIDTH
+_H = GameConstants.HEIGHT
+
+# Colors are parsed from their names once rather than on every draw call
+_BOARD_COLORS = (p.Color("white"), p.Color("gray"))
+_HIGHLIGHT_COLOR = p.Color('red')
+_TEXT_COLOR = p.Color('black')
+_DIALOG_COLOR = p.Color('white')
+_DIALOG_BORDER_COLOR = p.Color('black')
+_FONT_SIZE = 36
+
+# Promotion options, left to right in the dialog
+_PROMOTION_PIECES = ('Q', 'R', 'B', 'N')
+
+# Every message _status_text can produce, rendered once when the renderer is created
+_STATUS_MESSAGES = (
+    "White is in check!",
+    "Black is in check!",
+    "Checkmate! White wins!",
+    "Checkmate! Black wins!",
+    "Stalemate!",
+)
 
 class UIRenderer:
     """
@@ -10,6 +37,19 @@ class UIRenderer:
     
     Attributes:
         screen: The pygame surface object representing the game window
+        board_surface: Pre-rendered checkerboard, blitted as the background each frame
+        rects: 8x8 grid of square Rects indexed as rects[row][col]
+        square_rects: The same Rects flattened and indexed by bitboard square index
+        highlight_tiles: Selected-square backgrounds (board color, red overlay and border)
+            composited once per square color, indexed by (row + col) % 2
+        font: Font used for game state messages
+        text_cache: Rendered message surfaces keyed by their text
+        position_surface: Board with all pieces composited, patched only where moves change it
+        dialog_cache: Composed promotion dialog surfaces keyed by color prefix
+        promotion_rects: Screen Rects of the promotion options, used to place and hit-test the dialog
+        
+    The renderer remembers what it last drew (selection, status message) so that
+    draw_changes can repaint just the squares that differ from the previous frame.
     """
     
     def __init__(self, screen):
@@ -20,101 +60,278 @@ class UIRenderer:
             screen: The pygame surface to render on
         """
         self.screen = screen
+        self.rects = [[p.Rect(c * _SQ, r * _SQ, _SQ, _SQ) for c in range(_DIM)] for r in range(_DIM)]
+        self.square_rects = [rect for row in self.rects for rect in row]
+        self.board_surface = self._build_board_surface()
+        self.highlight_tiles = self._build_highlight_tiles()
+        self.font = p.font.Font(None, _FONT_SIZE)
+        self.text_cache = {msg: self._render_text(msg) for msg in _STATUS_MESSAGES}
+        self.position_surface = self.board_surface.copy()
+        self._position_stale = True
+        self._drawn_selection = ()
+        self._drawn_status = None
+        self._full_redraw = True
+        self.dialog_cache = {}
+        self.promotion_rects = self._build_promotion_rects()
         
     def draw_game_state(self, gs, sq_selected):
         """
         Render the complete game state including board, pieces, and status messages.
         
+        Rebuilds the cached board-and-pieces surface from scratch, so it is always
+        correct regardless of what was drawn before.
+        
+        Args:
+            gs: Current GameState object containing board state and game conditions
+            sq_selected: Tuple of (row, col) for the currently selected square, or empty tuple
+        """
+        self._rebuild_position_surface(gs)
+        self._draw_full(gs, sq_selected)
+
+    def draw_changes(self, gs, sq_selected, changed_squares):
+        """
+        Repaint only the squares that changed since the previous frame.
+        
+        Falls back to a full redraw when the status message appears, disappears or
+        would be overdrawn, or after something (like the promotion dialog) has
+        painted over the board. Either way the cached board-and-pieces surface is
+        patched rather than rebuilt.
+        
         Args:
             gs: Current GameState object containing board state and game conditions
             sq_selected: Tuple of (row, col) for the currently selected square, or empty tuple
+            changed_squares: Set of (row, col) squares modified by moves since the last frame
+            
+        Returns:
+            list: Rects to pass to pygame.display.update (empty if nothing changed)
+        """
+        if self._position_stale:
+            self._rebuild_position_surface(gs)
+        else:
+            for row, col in changed_squares:
+                self._refresh_position_square(gs, row, col)
+        
+        dirty = set(changed_squares)
+        if sq_selected != self._drawn_selection:
+            dirty.update(sq for sq in (self._drawn_selection, sq_selected) if sq != ())
+        
+        status = self._status_text(gs)
+        if self._full_redraw or status != self._drawn_status or (status and dirty):
+            self._draw_full(gs, sq_selected)
+            return [self.screen.get_rect()]
+        
+        for row, col in dirty:
+            self._draw_square(gs, row, col, (row, col) == sq_selected)
+        self._drawn_selection = sq_selected
+        return [self.rects[row][col] for row, col in dirty]
+
+    def request_full_redraw(self):
         """
-        self.draw_board()  # draw squares on the board
+        Make the next draw_changes call repaint the whole window.
+        
+        Used when the window contents were lost, e.g. after it was uncovered or restored.
+        """
+        self._full_redraw = True
+
+    def _draw_full(self, gs, sq_selected):
+        """
+        Draw the whole frame from the cached board-and-pieces surface.
+        
+        Args:
+            gs: Current GameState object containing board state and game conditions
+            sq_selected: Tuple of (row, col) for the currently selected square, or empty tuple
+        """
+        self.screen.blit(self.position_surface, (0, 0))
         if sq_selected != ():  # if a square is selected
-            self.highlight_square(sq_selected)
-        self.draw_pieces(gs.board)  # draw pieces on top of those squares
+            self._draw_square(gs, sq_selected[0], sq_selected[1], True)
         
         # Draw game state messages after everything else
+        status = self._status_text(gs)
+        if status:
+            self.draw_text(status)
+        
+        self._drawn_selection = sq_selected
+        self._drawn_status = status
+        self._full_redraw = False
+
+    def _draw_square(self, gs, row, col, selected):
+        """
+        Draw a single square to the screen.
+        
+        Unselected squares are copied straight from the cached position surface; the
+        selected square is layered as highlighted background, then piece.
+        
+        Args:
+            gs: Current GameState object containing board state
+            row: Row of the square
+            col: Column of the square
+            selected: Whether the square is the current selection
+        """
+        rect = self.rects[row][col]
+        if not selected:
+            self.screen.blit(self.position_surface, rect, rect)
+            return
+        from src.resource_manager import PIECE_IMAGES
+        self.highlight_square((row, col))
+        piece_id = gs.piece_ids[row * _DIM + col]
+        if piece_id != NO_PIECE:
+            self.screen.blit(PIECE_IMAGES[piece_id], rect)
+
+    def _rebuild_position_surface(self, gs):
+        """
+        Composite the board and every piece onto the cached position surface.
+        
+        Args:
+            gs: Current GameState object containing board state
+        """
+        self.position_surface.blit(self.board_surface, (0, 0))
+        self.draw_pieces(gs.bitboards, self.position_surface)
+        self._position_stale = False
+
+    def _refresh_position_square(self, gs, row, col):
+        """
+        Repaint one square of the cached position surface after a move changed it.
+        
+        Args:
+            gs: Current GameState object containing board state
+            row: Row of the square
+            col: Column of the square
+        """
+        from src.resource_manager import PIECE_IMAGES
+        rect = self.rects[row][col]
+        self.position_surface.blit(self.board_surface, rect, rect)
+        piece_id = gs.piece_ids[row * _DIM + col]
+        if piece_id != NO_PIECE:
+            self.position_surface.blit(PIECE_IMAGES[piece_id], rect)
+
+    def _status_text(self, gs):
+        """
+        Get the check/checkmate/stalemate message for the current game state.
+        
+        Args:
+            gs: Current GameState object
+            
+        Returns:
+            str: The message to display, or None if there is nothing to show
+        """
         if gs.checkmate:
-            text = f"Checkmate! {'Black' if gs.whiteToMove else 'White'} wins!"
-            self.draw_text(text)
+            return f"Checkmate! {'Black' if gs.whiteToMove else 'White'} wins!"
         elif gs.stalemate:
-            self.draw_text("Stalemate!")
+            return "Stalemate!"
         elif gs.in_check:
-            text = f"{'White' if gs.whiteToMove else 'Black'} is in check!"
-            self.draw_text(text)
+            return f"{'White' if gs.whiteToMove else 'Black'} is in check!"
+        return None
 
     def highlight_square(self, square):
         """
         Highlight the selected square with a red border and semi-transparent overlay.
         
+        Paints the whole square, board color included, from a pre-composited tile.
+        
         Args:
             square: Tuple of (row, col) coordinates of the square to highlight
         """
         if square != ():  # if square is selected
             row, col = square
-            s = p.Surface((int(GameConstants.SQ_SIZE), int(GameConstants.SQ_SIZE)))
-            s.set_alpha(UIConstants.TRANSPARENCY_ALPHA)
-            s.fill(p.Color('red'))
-            self.screen.blit(s, (col * int(GameConstants.SQ_SIZE), row * int(GameConstants.SQ_SIZE)))
+            self.screen.blit(self.highlight_tiles[(row + col) % 2], self.rects[row][col])
+
+    def _build_highlight_tiles(self):
+        """
+        Composite the highlighted square once for each board color.
+        
+        Returns:
+            tuple: Light and dark tiles, each the board square with the red overlay and border
+        """
+        overlay = p.Surface((_SQ, _SQ)).convert()
+        overlay.set_alpha(UIConstants.TRANSPARENCY_ALPHA)
+        overlay.fill(_HIGHLIGHT_COLOR)
+        tiles = []
+        for color_index in range(len(_BOARD_COLORS)):
+            tile = self.board_surface.subsurface(self.rects[0][color_index]).copy()
+            tile.blit(overlay, (0, 0))
             # Draw border
-            p.draw.rect(self.screen, p.Color('red'), 
-                       p.Rect(col * int(GameConstants.SQ_SIZE), row * int(GameConstants.SQ_SIZE), 
-                             int(GameConstants.SQ_SIZE), int(GameConstants.SQ_SIZE)), 
-                       UIConstants.BORDER_WIDTH)
+            p.draw.rect(tile, _HIGHLIGHT_COLOR, tile.get_rect(), UIConstants.BORDER_WIDTH)
+            tiles.append(tile)
+        return tuple(tiles)
 
     def draw_board(self):
         """
-        Draw the chess board squares in alternating colors.
+        Draw the chess board by blitting the pre-rendered checkerboard surface.
+        """
+        self.screen.blit(self.board_surface, (0, 0))
+
+    def _build_board_surface(self):
+        """
+        Render the chess board squares in alternating colors onto a cached surface.
         Creates a standard 8x8 checkerboard pattern where the top-left square is light.
+        The board never changes, so this runs once and every frame reuses the result.
+        
+        Returns:
+            Surface: The checkerboard, converted to the display pixel format
         """
-        colors = [p.Color("white"), p.Color("gray")]
-        for r in range(int(GameConstants.DIMENSION)):
-            for c in range(int(GameConstants.DIMENSION)):
-                color = colors[((r + c) % 2)]
-                p.draw.rect(
-                    self.screen, color, 
-                    p.Rect(c * int(GameConstants.SQ_SIZE), r * int(GameConstants.SQ_SIZE), 
-                          int(GameConstants.SQ_SIZE), int(GameConstants.SQ_SIZE))
-                )
+        surface = p.Surface((_W, _H))
+        for r in range(_DIM):
+            for c in range(_DIM):
+                surface.fill(_BOARD_COLORS[((r + c) % 2)], self.rects[r][c])
+        return surface.convert()
 
-    def draw_pieces(self, board):
+    def draw_pieces(self, bitboards, target=None):
         """
         Draw chess pieces on the board using their corresponding images.
         
+        Walks the set bits of each piece's bitboard, so only occupied squares are
+        visited instead of scanning all 64.
+        
         Args:
-            board: 2D list representing the current board state with piece positions
+            bitboards: List of bitboards indexed by piece id (see constants.PIECE_IDS)
+            target: Surface to draw on; defaults to the screen
         """
-        from src.resource_manager import IMAGES
-        for r in range(int(GameConstants.DIMENSION)):
-            for c in range(int(GameConstants.DIMENSION)):
-                piece = board[r][c]
-                if piece != "--":  # not empty square
-                    self.screen.blit(
-                        IMAGES[piece], 
-                        p.Rect(c * int(GameConstants.SQ_SIZE), r * int(GameConstants.SQ_SIZE), 
-                              int(GameConstants.SQ_SIZE), int(GameConstants.SQ_SIZE))
-                    )
+        from src.resource_manager import PIECE_IMAGES
+        if target is None:
+            target = self.screen
+        square_rects = self.square_rects
+        # Hand every piece to pygame in one call rather than one blit per piece
+        target.blits(
+            [(PIECE_IMAGES[piece_id], square_rects[sq])
+             for piece_id, bb in enumerate(bitboards)
+             for sq in iter_bits(bb)],
+            doreturn=False
+        )
 
     def draw_text(self, text):
         """
         Draw text centered on the screen, used for game state messages.
         
+        Rendered surfaces are cached per message, so repeated frames showing the
+        same message only pay for a blit.
+        
         Args:
             text: The message to display
         """
-        font = p.font.Font(None, 36)
-        text_surface = font.render(text, True, p.Color('black'))
-        text_rect = text_surface.get_rect()
-        text_rect.center = (int(GameConstants.WIDTH) // 2, int(GameConstants.HEIGHT) // 2)
-        self.screen.blit(text_surface, text_rect)
+        text_surface = self.text_cache.get(text)
+        if text_surface is None:
+            text_surface = self.text_cache[text] = self._render_text(text)
+        self.screen.blit(text_surface, text_surface.get_rect(center=(_W // 2, _H // 2)))
+
+    def _render_text(self, text):
+        """
+        Render a message with the message font and color.
+        
+        Args:
+            text: The message to render
+            
+        Returns:
+            Surface: The antialiased text, converted to the display pixel format
+        """
+        return self.font.render(text, True, _TEXT_COLOR).convert_alpha()
 
     def show_promotion_dialog(self, is_white_turn):
         """
         Show a dialog for selecting a piece during pawn promotion.
         
         Displays a dialog with available pieces (Queen, Rook, Bishop, Knight)
-        and waits for the player to make a selection.
+        and blocks on the event queue until the player makes a selection. Closing
+        the window picks a Queen and leaves the QUIT event queued for the caller.
         
         Args:
             is_white_turn: Boolean indicating if it's white's turn to promote
@@ -122,41 +339,64 @@ class UIRenderer:
         Returns:
             str: The identifier of the selected piece (e.g., 'wQ' for white queen)
         """
+        color_prefix = 'w' if is_white_turn else 'b'
+        dialog_surface = self.dialog_cache.get(color_prefix)
+        if dialog_surface is None:
+            dialog_surface = self.dialog_cache[color_prefix] = self._build_promotion_dialog(color_prefix)
+        
+        origin = self.promotion_rects[0]  # first option sits at the dialog origin
+        self.screen.blit(dialog_surface, origin)
+        p.display.flip()
+        self._full_redraw = True  # the dialog covers the board until the next full frame
+        
+        # Wait for user selection, sleeping until the next event arrives
+        while True:
+            e = p.event.wait()
+            if e.type == p.QUIT:
+                p.event.post(e)  # leave the quit request for the main loop
+                break
+            if e.type == p.MOUSEBUTTONDOWN:
+                mouse_x, mouse_y = p.mouse.get_pos()
+                # Options are equal-width squares in a row, so the column gives the choice
+                option = (mouse_x - origin.x) // _SQ
+                if 0 <= option < len(_PROMOTION_PIECES) and origin.top <= mouse_y < origin.bottom:
+                    return color_prefix + _PROMOTION_PIECES[option]
+        return color_prefix + 'Q'  # Default to Queen if dialog is closed
+
+    def _build_promotion_dialog(self, color_prefix):
+        """
+        Compose the promotion dialog for one color: border plus the four piece options.
+        
+        Built on first use, since the piece images are loaded after the renderer is created.
+        
+        Args:
+            color_prefix: 'w' or 'b'
+            
+        Returns:
+            Surface: The dialog, converted to the display pixel format
+        """
         from src.resource_manager import IMAGES
-        dialog_width = int(GameConstants.SQ_SIZE) * UIConstants.PROMOTION_DIALOG_WIDTH_SQUARES
-        dialog_height = int(GameConstants.SQ_SIZE) * UIConstants.PROMOTION_DIALOG_HEIGHT_SQUARES
-        dialog_x = (int(GameConstants.WIDTH) - dialog_width) // 2
-        dialog_y = (int(GameConstants.HEIGHT) - dialog_height) // 2
+        dialog_width = _SQ * UIConstants.PROMOTION_DIALOG_WIDTH_SQUARES
+        dialog_height = _SQ * UIConstants.PROMOTION_DIALOG_HEIGHT_SQUARES
         
         # Draw dialog background
         dialog_surface = p.Surface((dialog_width, dialog_height))
-        dialog_surface.fill(p.Color('white'))
-        p.draw.rect(dialog_surface, p.Color('black'), 
+        dialog_surface.fill(_DIALOG_COLOR)
+        p.draw.rect(dialog_surface, _DIALOG_BORDER_COLOR, 
                    p.Rect(0, 0, dialog_width, dialog_height), UIConstants.BORDER_WIDTH)
         
-        # Available pieces for promotion
-        color_prefix = 'w' if is_white_turn else 'b'
-        pieces = ['Q', 'R', 'B', 'N']
-        piece_rects = []
-        
         # Draw piece options
-        for i, piece in enumerate(pieces):
-            piece_img = IMAGES[color_prefix + piece]
-            x = i * int(GameConstants.SQ_SIZE)
-            piece_rects.append(p.Rect(dialog_x + x, dialog_y, 
-                                    int(GameConstants.SQ_SIZE), int(GameConstants.SQ_SIZE)))
-            dialog_surface.blit(piece_img, (x, 0))
-        
-        self.screen.blit(dialog_surface, (dialog_x, dialog_y))
-        p.display.flip()
+        for i, piece in enumerate(_PROMOTION_PIECES):
+            dialog_surface.blit(IMAGES[color_prefix + piece], (i * _SQ, 0))
+        return dialog_surface.convert()
+
+    def _build_promotion_rects(self):
+        """
+        Compute the screen Rects of the promotion options, in _PROMOTION_PIECES order.
         
-        # Wait for user selection
-        waiting = True
-        while waiting:
-            for e in p.event.get():
-                if e.type == p.MOUSEBUTTONDOWN:
-                    mouse_pos = p.mouse.get_pos()
-                    for i, rect in enumerate(piece_rects):
-                        if rect.collidepoint(mouse_pos):
-                            return color_prefix + pieces[i]
-        return color_prefix + 'Q'  # Default to Queen if dialog is closed
\ No newline at end of file
+        Returns:
+            list: One square Rect per option, left to right across the centered dialog
+        """
+        dialog_x = (_W - _SQ * UIConstants.PROMOTION_DIALOG_WIDTH_SQUARES) // 2
+        dialog_y = (_H - _SQ * UIConstants.PROMOTION_DIALOG_HEIGHT_SQUARES) // 2
+        return [p.Rect(dialog_x + i * _SQ, dialog_y, _SQ, _SQ) for i in range(len(_PROMOTION_PIECES))]
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+Zobrist keys for hashing chess positions.
+
+A position's key is the XOR of one random 64-bit number per piece on its square,
+plus keys for the side to move, the castling rights and the en passant file.
+XOR is its own inverse, so a move updates the key by toggling just the keys of
+the squares it changes.
+"""
+import random
+from src.constants import PIECES
+
+_rng = random.Random(0x5EED)  # fixed seed, so keys are the same on every run
+
+# Indexed [piece_id][square index]
+PIECE_SQUARE_KEYS = tuple(tuple(_rng.getrandbits(64) for _ in range(64)) for _ in PIECES)
+BLACK_TO_MOVE_KEY = _rng.getrandbits(64)
+CASTLING_KEYS = tuple(_rng.getrandbits(64) for _ in range(16))  # indexed by castling rights mask
+EN_PASSANT_FILE_KEYS = tuple(_rng.getrandbits(64) for _ in range(8))
@@ -0,0 +1,67 @@
+import logging as log
+import unittest
+from src.constants import Square, CastlingFlags
+from src.game_engine import GameState
+from src.moves import Move
+
+log.disable(log.CRITICAL)
+
+
+def _position(pieces, white_to_move=True):
+    """
+    Build a GameState holding only the given pieces, with no castling rights.
+
+    Args:
+        pieces: Dict mapping (row, col) to the Square placed there
+        white_to_move: Whether white is the side to move
+
+    Returns:
+        GameState: The position
+    """
+    gs = GameState()
+    for row in range(8):
+        for col in range(8):
+            gs._set_square(row, col, pieces.get((row, col), Square.EMPTY))
+    gs.castlingRights = 0
+    if not white_to_move:
+        gs.swap_players()
+    return gs
+
+
+class MoveLegalityTests(unittest.TestCase):
+
+    def test_promotion_can_block_check(self):
+        # White Ka8, Pb7; black Rh8, Nc6, Kh1: b7-b8 is the only move
+        gs = _position({(0, 0): Square.wK, (1, 1): Square.wp,
+                        (0, 7): Square.bR, (2, 2): Square.bN, (7, 7): Square.bK})
+        moves = [move.getChessNotation() for move in gs.get_all_possible_moves()]
+        self.assertEqual(moves, ['b7b8'])
+        gs.update_game_state()
+        self.assertFalse(gs.checkmate)
+
+    def test_en_passant_cannot_expose_king_along_rank(self):
+        # White Ka5, Pb5; black Pc5 (just double-pushed), Rh5, Kh8
+        gs = _position({(3, 0): Square.wK, (3, 1): Square.wp,
+                        (3, 2): Square.bp, (3, 7): Square.bR, (0, 7): Square.bK})
+        gs.enPassantPossible = (2, 2)
+        move = Move((3, 1), (2, 2), gs)
+        self.assertFalse(gs.checkMoveValidity(move))
+        self.assertNotIn('b5c6', [m.getChessNotation() for m in gs.get_all_possible_moves()])
+
+    def test_queenside_castling_needs_knight_square_empty(self):
+        # White Ke1, Ra1, Nb1; black Ke8: c1, d1 are empty but b1 is not
+        pieces = {(7, 4): Square.wK, (7, 0): Square.wR, (7, 1): Square.wN, (0, 4): Square.bK}
+        gs = _position(pieces)
+        gs.castlingRights = CastlingFlags.WHITE_QUEENSIDE
+        self.assertFalse(gs.checkMoveValidity(Move((7, 4), (7, 2), gs)))
+
+        del pieces[(7, 1)]
+        gs = _position(pieces)
+        gs.castlingRights = CastlingFlags.WHITE_QUEENSIDE
+        move = Move((7, 4), (7, 2), gs)
+        self.assertTrue(gs.checkMoveValidity(move))
+        self.assertTrue(move.isCastling)
+
+
+if __name__ == '__main__':
+    unittest.main()